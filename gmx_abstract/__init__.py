@@ -1,3 +1,5 @@
+from web3 import Web3
+
 TOKEN_ABI = [
     {
         "constant": True,
@@ -65,3 +67,7 @@ ERC_20_DATA = {
     ]
 }
 
+for _token in ERC_20_DATA["erc20Tokens"]:
+    _token["address_checksum"] = Web3.to_checksum_address(_token["address"])
+
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
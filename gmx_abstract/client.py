@@ -1,19 +1,25 @@
 from gmx_abstract.utils import (
     configure,
-    position_are_the_same,
-    get_erc20tokens,
-    get_eth_balance
+    create_http_session,
+    get_collateral_balances_raw,
+    aget_erc20tokens,
+    aget_eth_balance,
+    aget_block_number
 )
 from gmx_abstract.models import Position, TokenBalance
 from gmx_abstract.errors import PositionFetchError
-from typing import List, Iterator, Tuple
+from typing import Dict, List, Iterator, AsyncIterator, Tuple
 from gmx_python_sdk.scripts.v2.get.get_open_positions import GetOpenPositions
 from gmx_python_sdk.scripts.v2.order.create_deposit_order import DepositOrder
 from gmx_python_sdk.scripts.v2.order.liquidity_argument_parser import LiquidityArgumentParser
 
 
-from time import sleep
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, ALL_COMPLETED
 from datetime import datetime
+import aiohttp
 import requests
 from web3 import Web3
 
@@ -25,14 +31,19 @@ class GmxClient:
     Attributes:
         address (str): The Ethereum address associated with the client.
         rpc_url (str): The RPC URL used to connect to the Ethereum network.
+        session (requests.Session): The keep-alive HTTP session shared by all RPC calls.
+        positions_ttl (float): How long, in seconds, fetched positions are served from cache.
 
     Methods:
         get_positions(address): Retrieves open positions for a specified Ethereum address.
         get_my_positions(): Retrieves open positions associated with the client's Ethereum address.
         poll_positions(address, wait_seconds): Periodically checks for changes in positions at a specified Ethereum address.
+        apoll_positions(address, wait_seconds): Asynchronous version of poll_positions, for use on an event loop.
+        get_positions_and_balances(address): Fetches open positions and collateral balances concurrently.
     """
 
-    def __init__(self, address: str = "", private_key: str = "", rpc_url: str = "https://arb1.arbitrum.io/rpc"):
+    def __init__(self, address: str = "", private_key: str = "", rpc_url: str = "https://arb1.arbitrum.io/rpc",
+                 positions_ttl: float = 0.5):
         """
         Initializes the GmxClient with an Ethereum address, private key, and RPC URL.
 
@@ -40,13 +51,66 @@ class GmxClient:
             address (str): The Ethereum address to associate with this client.
             private_key (str): The private key for the Ethereum address, used to configure API access.
             rpc_url (str): The RPC URL to connect to the Ethereum network.
+            positions_ttl (float): How long, in seconds, `get_positions` results are reused for the same
+                address. The default fits Arbitrum's block cadence; 0 disables the cache.
         """
         configure(private_key, address, rpc_url)
         self.address = address
         self.rpc_url = rpc_url
-        self.web3_client = Web3(Web3.HTTPProvider(rpc_url))
+        self.session = create_http_session()
+        self.web3_client = Web3(Web3.HTTPProvider(rpc_url, session=self.session, request_kwargs={'timeout': 10}))
         if not self.web3_client.is_connected():
             raise ValueError("Invalid RPC URL")
+        self._aiohttp_session = None
+        self._aiohttp_loop = None
+        self.positions_ttl = positions_ttl
+        self._pos_cache: Dict[str, Tuple[float, List[Position]]] = {}
+        # Per-address fetch lock and the number of callers holding or waiting on it. Both the lookup and
+        # the eviction of these entries happen under _pos_locks_guard, so a lock is only dropped when idle.
+        self._pos_locks: Dict[str, List] = {}
+        self._pos_locks_guard = threading.Lock()
+
+    def _get_aiohttp_session(self) -> aiohttp.ClientSession:
+        """
+        Returns the client's aiohttp session, creating it on first use. An aiohttp session is bound
+        to the event loop it was created on, so a new one is created when called from another loop.
+
+        A session left open on a loop that is still running is closed on that loop. One left open on a
+        loop that has already finished can no longer be closed, so close the session with `aclose()`,
+        or use the client as an async context manager, before each event loop ends.
+        """
+        loop = asyncio.get_running_loop()
+        if self._aiohttp_session is None or self._aiohttp_session.closed or self._aiohttp_loop is not loop:
+            stale_session = self._aiohttp_session
+            if stale_session is not None and not stale_session.closed and self._aiohttp_loop.is_running():
+                asyncio.run_coroutine_threadsafe(stale_session.close(), self._aiohttp_loop)
+
+            self._aiohttp_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=50),
+                timeout=aiohttp.ClientTimeout(total=10)
+            )
+            self._aiohttp_loop = loop
+
+        return self._aiohttp_session
+
+    async def aclose(self):
+        """
+        Closes the aiohttp session used by the asynchronous methods, if one was opened.
+        """
+        if self._aiohttp_session is not None and not self._aiohttp_session.closed:
+            await self._aiohttp_session.close()
+
+    async def __aenter__(self) -> "GmxClient":
+        """
+        Returns the client, so `async with client:` closes its aiohttp session on exit.
+        """
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """
+        Closes the aiohttp session opened on the current event loop.
+        """
+        await self.aclose()
 
     def get_positions(self, address: str) -> List[Position]:
         """
@@ -60,15 +124,120 @@ class GmxClient:
 
         Raises:
             PositionFetchError: If there is an error in fetching positions due to a JSON decode error.
+
+        Notes:
+            Results are cached per address for `positions_ttl` seconds, and concurrent callers asking for
+            the same address while a fetch is in flight wait for it and share its result. Expired entries
+            are evicted whenever a new result is stored.
+
+            The returned list is a fresh copy, but the Position objects in it are shared with every other
+            caller served from the same cache entry. They fill in their fields lazily on first access,
+            so treat them as read-only.
         """
+        cached = self._pos_cache.get(address)
+        if cached is not None and time.monotonic() - cached[0] < self.positions_ttl:
+            return list(cached[1])
+
+        with self._pos_locks_guard:
+            entry = self._pos_locks.get(address)
+            if entry is None:
+                entry = self._pos_locks[address] = [threading.Lock(), 0]
+            entry[1] += 1
+
         try:
-            positions = GetOpenPositions(chain='arbitrum', address=address)
-            return [Position(position_id=key, data=data) for key, data in positions.get_data().items()]
+            with entry[0]:
+                # Another caller may have refreshed the cache while this one waited for the lock.
+                cached = self._pos_cache.get(address)
+                if cached is not None and time.monotonic() - cached[0] < self.positions_ttl:
+                    return list(cached[1])
+
+                positions = [Position(position_id=key, data=data) for key, data in self._fetch_position_data(address).items()]
+                now = time.monotonic()
+                self._pos_cache[address] = (now, positions)
+        finally:
+            with self._pos_locks_guard:
+                entry[1] -= 1
+
+        self._evict_expired_positions(now)
+
+        return list(positions)
+
+    def _evict_expired_positions(self, now: float):
+        """
+        Drops cached positions older than `positions_ttl`, and the locks of addresses that are no longer
+        cached and that no caller holds or waits on.
+        """
+        with self._pos_locks_guard:
+            for address, (fetched_at, _) in list(self._pos_cache.items()):
+                if now - fetched_at >= self.positions_ttl:
+                    self._pos_cache.pop(address, None)
+
+            for address, (_, users) in list(self._pos_locks.items()):
+                if users == 0 and address not in self._pos_cache:
+                    del self._pos_locks[address]
+
+    def _fetch_position_data(self, address: str) -> dict:
+        """
+        Fetches the raw open position data for an address from gmx_python_sdk, keyed by position id.
+
+        Raises:
+            PositionFetchError: If there is an error in fetching positions due to a JSON decode error.
+        """
+        try:
+            return GetOpenPositions(chain='arbitrum', address=address).get_data()
         except NameError:
-            return []
+            return {}
         except requests.exceptions.JSONDecodeError as e:
             raise PositionFetchError(e.request, e.response)
 
+    def _refresh_positions_into(self, address: str, positions_by_id: Dict[str, Position]) \
+        -> Tuple[List[Position], List[Position], List[Tuple[Position, Position]]]:
+        """
+        Fetches the open positions for an address and applies them to `positions_by_id` in place.
+
+        Positions whose raw data is unchanged are kept as they are, without building a new Position.
+        Any other position is rebuilt and replaces the previous one, which is only compared (with
+        Position.__eq__) against its own previous state.
+
+        Parameters:
+            address (str): The Ethereum address to retrieve positions for.
+            positions_by_id (Dict[str, Position]): The positions from the previous refresh, keyed by position id.
+
+        Returns:
+            Tuple[List[Position], List[Position], List[Tuple[Position, Position]]]: The positions that were
+            added and removed by this refresh, and a (previous, current) pair for each modified position.
+        """
+        position_data = self._fetch_position_data(address)
+
+        # Work out the whole diff before touching positions_by_id, so a failure part way through
+        # (e.g. malformed data from the SDK) leaves the previous state intact for the next refresh.
+        removed_ids = positions_by_id.keys() - position_data.keys()
+        added = []
+        modified = []
+        replacements = []
+
+        for position_id, data in position_data.items():
+            position = positions_by_id.get(position_id)
+            if position is not None and data == position._data:
+                continue
+
+            candidate = Position(position_id=position_id, data=data)
+            candidate._load()
+
+            if position is None:
+                added.append(candidate)
+                continue
+
+            if candidate != position:
+                modified.append((position, candidate))
+            replacements.append(candidate)
+
+        removed = [positions_by_id.pop(position_id) for position_id in removed_ids]
+        for position in added + replacements:
+            positions_by_id[position.position_id] = position
+
+        return added, removed, modified
+
     def get_my_positions(self) -> List[Position]:
         """
         Retrieves open positions associated with the client's Ethereum address.
@@ -78,31 +247,80 @@ class GmxClient:
         """
         return self.get_positions(self.address)
     
-    def poll_positions(self, address: str, wait_seconds: int, debug : bool = False) -> Iterator[Tuple[List[Position], List[Position]]]:
+    async def aget_positions(self, address: str) -> List[Position]:
         """
-        Periodically checks and emits changes in positions for a specified Ethereum address.
+        Asynchronously fetches open positions for a specified Ethereum address.
+
+        gmx_python_sdk only offers a blocking API, so the fetch runs on the event loop's default
+        thread pool while the loop stays free for other work.
+
+        Parameters:
+            address (str): The Ethereum address to retrieve positions for.
+
+        Returns:
+            List[Position]: A list of Position objects representing the open positions.
+        """
+        return await asyncio.to_thread(self.get_positions, address)
+
+    async def apoll_positions(self, address: str, wait_seconds: int, debug : bool = False, max_interval: float = None) \
+        -> AsyncIterator[Tuple[List[Position], List[Position], List[Tuple[Position, Position]]]]:
+        """
+        Periodically checks and emits changes in positions for a specified Ethereum address, without
+        blocking the event loop between polls. Many addresses can be polled concurrently on one loop.
 
         Parameters:
             address (str): The Ethereum address to poll for changes in positions.
-            wait_seconds (int): The interval, in seconds, between each poll.
+            wait_seconds (int): The base interval, in seconds, between the start of each poll.
+            max_interval (float): The longest interval, in seconds, the poll may back off to while
+                positions stay unchanged. Defaults to wait_seconds, which disables the back-off.
 
         Yields:
-            Tuple[List[Position], List[Position]]: A tuple containing lists of Position objects before and after changes detected.
+            Tuple[List[Position], List[Position], List[Tuple[Position, Position]]]: The positions added and
+            removed since the previous poll, and a (previous, current) pair for each modified position,
+            whenever at least one of them is non-empty.
 
         Notes:
             This function runs indefinitely until manually stopped. It tracks the duration of each poll cycle and logs the time taken.
+            The time spent fetching is subtracted from the next sleep, and every poll that finds no change grows the interval
+            by 1.5x up to max_interval. The interval resets to wait_seconds as soon as a change is detected.
+            Each poll first reads the latest block number and skips fetching positions if no new block has been mined.
+
+            Open positions are kept between polls and a position is only rebuilt when its data changes, so
+            yielded Position objects are never modified afterwards. Subtracting the previous position from
+            the current one of a modified pair gives the PositionDelta between them.
         """
-        last_positions = self.get_positions(address=address)
+        if max_interval is None:
+            max_interval = wait_seconds
+
+        positions_by_id = {}
+        # Read before the positions, so a block mined during the fetch triggers a refetch next round.
+        last_block_number = await aget_block_number(self._get_aiohttp_session(), self.rpc_url)
+        await asyncio.to_thread(self._refresh_positions_into, address, positions_by_id)
         rounds = 0
+        interval = wait_seconds
+        fetch_duration = 0.0
         while True:
-            sleep(wait_seconds)
+            await asyncio.sleep(max(0, interval - fetch_duration))
+            fetch_duration = 0.0
             start = datetime.now()
             try:
-                new_positions = self.get_positions(address=address)
+                block_number = await aget_block_number(self._get_aiohttp_session(), self.rpc_url)
+                # Positions only change when a block is mined. An empty result may come from
+                # a swallowed fetch failure, so it is always refetched.
+                if block_number == last_block_number and positions_by_id:
+                    added, removed, modified = [], [], []
+                else:
+                    added, removed, modified = await asyncio.to_thread(
+                        self._refresh_positions_into, address, positions_by_id
+                    )
+                    last_block_number = block_number
+                fetch_duration = (datetime.now() - start).total_seconds()
                 rounds += 1
-                if not position_are_the_same(last_positions, new_positions):
-                    yield (last_positions, new_positions)
-                last_positions = new_positions
+                if added or removed or modified:
+                    interval = wait_seconds
+                    yield (added, removed, modified)
+                else:
+                    interval = min(max_interval, interval * 1.5)
             except PositionFetchError as e:
                 if debug:
                     print('Error during position fetch:', e)
@@ -112,15 +330,50 @@ class GmxClient:
 
             end = datetime.now()
             if debug:
-                print(f"{rounds} - took {(end - start).total_seconds()} seconds ({self.rpc_url})")
+                print(f"{rounds} - took {(end - start).total_seconds()} seconds, next poll in {interval} seconds ({self.rpc_url})")
+
+    def poll_positions(self, address: str, wait_seconds: int, debug : bool = False, max_interval: float = None) \
+        -> Iterator[Tuple[List[Position], List[Position], List[Tuple[Position, Position]]]]:
+        """
+        Periodically checks and emits changes in positions for a specified Ethereum address.
+
+        This is a blocking wrapper that drives `apoll_positions` on a private event loop;
+        see `apoll_positions` for the polling behaviour.
+
+        Parameters:
+            address (str): The Ethereum address to poll for changes in positions.
+            wait_seconds (int): The base interval, in seconds, between the start of each poll.
+            max_interval (float): The longest interval, in seconds, the poll may back off to while
+                positions stay unchanged. Defaults to wait_seconds, which disables the back-off.
+
+        Yields:
+            Tuple[List[Position], List[Position], List[Tuple[Position, Position]]]: The positions added and
+            removed since the previous poll, and a (previous, current) pair for each modified position,
+            whenever at least one of them is non-empty.
+
+        Notes:
+            This function runs indefinitely until manually stopped. It cannot be called from a running event loop;
+            use `apoll_positions` there instead.
+        """
+        loop = asyncio.new_event_loop()
+        changes = self.apoll_positions(address, wait_seconds, debug=debug, max_interval=max_interval)
+        try:
+            while True:
+                yield loop.run_until_complete(changes.__anext__())
+        finally:
+            loop.run_until_complete(changes.aclose())
+            if self._aiohttp_loop is loop:
+                loop.run_until_complete(self.aclose())
+            loop.run_until_complete(loop.shutdown_default_executor())
+            loop.close()
 
     def get_collateral_balances(self, address: str) -> List[TokenBalance]:
         """
         Retrieves the balance of ERC20 tokens and Ether for a given address.
 
         This function fetches balances of all ERC20 tokens associated with the provided address
-        using the `get_erc20tokens` method, and adds the Ether balance. The balance of Ether is 
-        retrieved by the `get_eth_balance` method, and represented as a `TokenBalance` object
+        together with the Ether balance, in a single JSON-RPC batch sent by `get_collateral_balances_raw`
+        over the client's HTTP session, with the token reads bundled into one Multicall3 call. The balance of Ether is represented as a `TokenBalance` object
         with an empty `contract_id` to distinguish it from ERC20 tokens.
 
         Parameters:
@@ -130,9 +383,11 @@ class GmxClient:
         - List[TokenBalance]: A list of `TokenBalance` objects, each representing the balance 
         of a specific token (ERC20 or Ether) at the given address.
         """
-        return get_erc20tokens(self.web3_client, address) + [
+        token_balances, eth_balance = get_collateral_balances_raw(self.session, self.rpc_url, address)
+
+        return token_balances + [
             TokenBalance(
-                balance=get_eth_balance(w3=self.web3_client, address=address),
+                balance=eth_balance,
                 contract_id="",
                 name="ETH"
             )
@@ -151,3 +406,65 @@ class GmxClient:
         of a specific token (ERC20 or Ether) at the user's address.
         """
         return self.get_collateral_balances(self.address)
+
+
+    def get_positions_and_balances(self, address: str) -> Tuple[List[Position], List[TokenBalance]]:
+        """
+        Fetches open positions and collateral balances for a given address concurrently.
+
+        The two reads are independent and spend most of their time waiting on RPC responses,
+        so running them on separate threads overlaps their round trips. The worker count stays
+        well below the HTTP session's connection pool size.
+
+        Parameters:
+        - address (str): The Ethereum address to query.
+
+        Returns:
+        - Tuple[List[Position], List[TokenBalance]]: The open positions and the collateral
+        balances at the given address.
+        """
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            positions_future = executor.submit(self.get_positions, address)
+            balances_future = executor.submit(self.get_collateral_balances, address)
+            wait([positions_future, balances_future], return_when=ALL_COMPLETED)
+
+        return positions_future.result(), balances_future.result()
+
+    def get_my_positions_and_balances(self) -> Tuple[List[Position], List[TokenBalance]]:
+        """
+        Fetches open positions and collateral balances for the user's address concurrently.
+
+        Returns:
+        - Tuple[List[Position], List[TokenBalance]]: The open positions and the collateral
+        balances at the user's address.
+        """
+        return self.get_positions_and_balances(self.address)
+
+
+    async def aget_collateral_balances(self, address: str) -> List[TokenBalance]:
+        """
+        Asynchronously retrieves the balance of ERC20 tokens and Ether for a given address.
+
+        The token reads, bundled into one Multicall3 call, and the Ether balance read are sent
+        concurrently over the client's aiohttp session.
+
+        Parameters:
+        - address (str): The Ethereum address to query the balances for.
+
+        Returns:
+        - List[TokenBalance]: A list of `TokenBalance` objects, each representing the balance
+        of a specific token (ERC20 or Ether) at the given address.
+        """
+        session = self._get_aiohttp_session()
+        token_balances, eth_balance = await asyncio.gather(
+            aget_erc20tokens(session, self.rpc_url, address),
+            aget_eth_balance(session, self.rpc_url, address)
+        )
+
+        return token_balances + [
+            TokenBalance(
+                balance=eth_balance,
+                contract_id="",
+                name="ETH"
+            )
+        ]
@@ -1,5 +1,9 @@
-
 class PositionFetchError(Exception):
     def __init__(self, request, response):
         self.request = request
-        self.response = response
\ No newline at end of file
+        self.response = response
+
+class RpcError(ValueError):
+    def __init__(self, message, response=None):
+        super().__init__(message)
+        self.response = response
@@ -1,3 +1,34 @@
+from sys import intern
+
+# Position attribute names mapped to the keys of the raw position dict returned by gmx_python_sdk.
+_FIELD_MAP = {
+    'account': 'account',
+    'market': 'market',
+    'market_symbol': 'market_symbol',
+    'collateral_token': 'collateral_token',
+    'position_size': 'position_size',
+    'size_in_tokens': 'size_in_tokens',
+    'entry_price': 'entry_price',
+    'initial_collateral_amount': 'inital_collateral_amount',
+    'initial_collateral_amount_usd': 'inital_collateral_amount_usd',
+    'leverage': 'leverage',
+    'borrowing_factor': 'borrowing_factor',
+    'funding_fee_amount_per_size': 'funding_fee_amount_per_size',
+    'long_token_claimable_funding_amount_per_size': 'long_token_claimable_funding_amount_per_size',
+    'short_token_claimable_funding_amount_per_size': 'short_token_claimable_funding_amount_per_size',
+    'position_modified_at': 'position_modified_at',
+    'is_long': 'is_long',
+    'percent_profit': 'percent_profit',
+    'mark_price': 'mark_price'
+}
+
+# Raw values wrapped in a single-element list by gmx_python_sdk.
+_UNWRAPPED_FIELDS = frozenset(('market_symbol', 'initial_collateral_amount_usd'))
+
+# Identifier strings, interned so equal values share one object and compare by identity.
+_INTERNED_FIELDS = frozenset(('account', 'market', 'market_symbol', 'collateral_token'))
+
+
 class Position:
     """
     A class to represent a trading position.
@@ -47,39 +78,81 @@ class Position:
     --------
     __init__(self, data, position_id)
         Initializes the Position object with the given data and position ID.
+    __getattr__(self, name)
+        Extracts a position attribute from the raw data on first access.
     __repr__(self)
         Returns a formatted string representation of the Position object.
     __eq__(self, other)
         Compares this position with another to check for equality.
+    __hash__(self)
+        Hashes the position's identifying attributes so positions can be stored in sets.
     __sub__(self, other)
         Subtracts one position from another to create a PositionDelta.
     json(self)
         Serializes the object to a JSON-compatible dictionary representation.
     """
+    __slots__ = (
+        "position_id",
+        "account",
+        "market",
+        "market_symbol",
+        "collateral_token",
+        "position_size",
+        "size_in_tokens",
+        "entry_price",
+        "initial_collateral_amount",
+        "initial_collateral_amount_usd",
+        "leverage",
+        "borrowing_factor",
+        "funding_fee_amount_per_size",
+        "long_token_claimable_funding_amount_per_size",
+        "short_token_claimable_funding_amount_per_size",
+        "position_modified_at",
+        "is_long",
+        "percent_profit",
+        "mark_price",
+        "_data"
+    )
+
     def __init__(self, data, position_id):
         """
-        Initializes the attributes of the Position class with data retrieved
-        from a dictionary based on the position_id.
+        Initializes the Position from the raw dictionary returned for the position_id.
+
+        Only the position_id is set eagerly; every other attribute is read from the
+        raw dictionary on first access and then kept on the instance.
+        """
+        self._data = data
+        self.position_id = intern(position_id)
+
+    def _load(self):
+        """
+        Extracts every attribute from the raw data now rather than on first access,
+        raising if the data is malformed.
+        """
+        for name in _FIELD_MAP:
+            getattr(self, name)
+
+    def __getattr__(self, name):
+        """
+        Extracts a position attribute from the raw data the first time it is read.
         """
-        self.position_id = position_id
-        self.account = data['account']
-        self.market = data['market']
-        self.market_symbol = data['market_symbol'][0]
-        self.collateral_token = data['collateral_token']
-        self.position_size = data['position_size']
-        self.size_in_tokens = data['size_in_tokens']
-        self.entry_price = data['entry_price']
-        self.initial_collateral_amount = data['inital_collateral_amount']
-        self.initial_collateral_amount_usd = data['inital_collateral_amount_usd'][0]
-        self.leverage = data['leverage']
-        self.borrowing_factor = data['borrowing_factor']
-        self.funding_fee_amount_per_size = data['funding_fee_amount_per_size']
-        self.long_token_claimable_funding_amount_per_size = data['long_token_claimable_funding_amount_per_size']
-        self.short_token_claimable_funding_amount_per_size = data['short_token_claimable_funding_amount_per_size']
-        self.position_modified_at = data['position_modified_at']
-        self.is_long = data['is_long']
-        self.percent_profit = data['percent_profit']
-        self.mark_price = data['mark_price']
+        key = _FIELD_MAP.get(name)
+        if key is None:
+            raise AttributeError(f"'Position' object has no attribute {name!r}")
+
+        try:
+            value = self._data[key]
+            if name in _UNWRAPPED_FIELDS:
+                value = value[0]
+        except (KeyError, IndexError, TypeError):
+            # Raw data missing the field behaves like a missing attribute, so hasattr() and
+            # getattr() with a default keep working.
+            raise AttributeError(f"'Position' object has no attribute {name!r}") from None
+        if name in _INTERNED_FIELDS:
+            value = intern(value)
+
+        setattr(self, name, value)
+        return value
 
     def __repr__(self):
         """
@@ -107,8 +180,11 @@ class Position:
 
         Notes:
         ------
-        The comparison checks for the exact match of string attributes and an
-        almost equality (considering floating point precision) for float attributes.
+        The comparison checks for the exact match of string attributes and integer
+        amounts first, then compares position_size, entry_price and leverage within
+        a small tolerance.
+
+        Positions with different position ids are never equal, and this is checked first.
 
         The comparison also goes beyond checking if the position id's are the same. 
         If you want to find one position in another list where the underlying amounts
@@ -116,28 +192,46 @@ class Position:
         """
         if not isinstance(other, Position):
             return False
-        
+
+        # position_id is interned, so matching ids usually pass on a pointer check; the string
+        # comparison only runs for ids that were not interned (e.g. unpickled or reassigned).
+        if self.position_id is not other.position_id and self.position_id != other.position_id:
+            return False
+
         return (
             self.account == other.account and
             self.market == other.market and
             self.market_symbol == other.market_symbol and
             self.collateral_token == other.collateral_token and
-            abs(self.position_size - other.position_size) < 1e-10 and
+            self.position_modified_at == other.position_modified_at and
+            self.is_long == other.is_long and
             self.size_in_tokens == other.size_in_tokens and
-            abs(self.entry_price - other.entry_price) < 1e-6 and
             self.initial_collateral_amount == other.initial_collateral_amount and
             self.initial_collateral_amount_usd == other.initial_collateral_amount_usd and
-            abs(self.leverage - other.leverage) < 1e-6 and
             self.borrowing_factor == other.borrowing_factor and
             self.funding_fee_amount_per_size == other.funding_fee_amount_per_size and
             self.long_token_claimable_funding_amount_per_size == other.long_token_claimable_funding_amount_per_size and
             self.short_token_claimable_funding_amount_per_size == other.short_token_claimable_funding_amount_per_size and
-            self.position_modified_at == other.position_modified_at and
-            self.is_long == other.is_long # and
-            # abs(self.percent_profit - other.percent_profit) < 1e-6 and
-            # abs(self.mark_price - other.mark_price) < 1e-6
+            abs(self.position_size - other.position_size) < 1e-10 and
+            abs(self.entry_price - other.entry_price) < 1e-6 and
+            abs(self.leverage - other.leverage) < 1e-6
+            # percent_profit and mark_price are intentionally left out of the comparison.
         )
 
+    def __hash__(self):
+        """
+        Returns a hash of the identifying attributes that __eq__ requires to match
+        exactly, so positions that compare equal always hash equal.
+        """
+        return hash((
+            self.position_id,
+            self.account,
+            self.market,
+            self.market_symbol,
+            self.collateral_token,
+            self.is_long
+        ))
+
     def __sub__(self, other):
         """
         Subtracts one position from another to create a PositionDelta, representing the change between them.
@@ -185,27 +279,7 @@ class Position:
         easily exported or used in APIs, ensuring that all numerical and string attributes
         are directly translatable into JSON format.
         """
-        return {
-            "position_id": self.position_id,
-            "account": self.account,
-            "market": self.market,
-            "market_symbol": self.market_symbol,
-            "collateral_token": self.collateral_token,
-            "position_size": self.position_size,
-            "size_in_tokens": self.size_in_tokens,
-            "entry_price": self.entry_price,
-            "initial_collateral_amount": self.initial_collateral_amount,
-            "initial_collateral_amount_usd": self.initial_collateral_amount_usd,
-            "leverage": self.leverage,
-            "borrowing_factor": self.borrowing_factor,
-            "funding_fee_amount_per_size": self.funding_fee_amount_per_size,
-            "long_token_claimable_funding_amount_per_size": self.long_token_claimable_funding_amount_per_size,
-            "short_token_claimable_funding_amount_per_size": self.short_token_claimable_funding_amount_per_size,
-            "position_modified_at": self.position_modified_at,
-            "is_long": self.is_long,
-            "percent_profit": self.percent_profit,
-            "mark_price": self.mark_price
-        }
+        return {"position_id": self.position_id, **{name: getattr(self, name) for name in _FIELD_MAP}}
 
 
 class PositionDelta:
@@ -232,6 +306,14 @@ class PositionDelta:
     __repr__(self)
         Return a formatted string representation of the PositionDelta object.
     """
+    __slots__ = (
+        "position_id",
+        "delta_collateral_amount",
+        "delta_collateral_amount_usd",
+        "delta_leverage",
+        "delta_mark_price"
+    )
+
     def __init__(self, initial_position: Position, new_position: Position):
         """
         Initializes the attributes of the PositionDelta class by calculating the
@@ -269,6 +351,7 @@ class TokenBalance:
     Methods:
         __str__(self): Returns a human-readable string representation of the TokenBalance.
     """
+    __slots__ = ("balance", "contract_id", "name")
 
     def __init__(self, balance, contract_id, name):
         """
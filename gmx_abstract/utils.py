@@ -1,8 +1,40 @@
 from gmx_python_sdk.scripts.v2.gmx_utils import Config, get_config
 from gmx_abstract.models import Position, TokenBalance
+from gmx_abstract.errors import RpcError
 from typing import List, Tuple
+from functools import lru_cache
+import asyncio
+import threading
+import aiohttp
+import orjson
+import requests
 from web3 import Web3
-from gmx_abstract import TOKEN_ABI, ERC_20_DATA
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from eth_abi import decode, encode
+from gmx_abstract import ERC_20_DATA, MULTICALL3_ADDRESS
+
+# Token decimals keyed by token address; decimals never change once a token is deployed.
+_DECIMALS_CACHE = {}
+
+# Wei per ether, and 10 ** decimals keyed by decimals, so balance conversion is a plain division.
+_ETH_WEI = 10 ** 18
+_DECIMALS_SCALE = {}
+
+# Function selectors of the ERC-20 reads, used to build calldata without going through web3.
+_DECIMALS_SELECTOR = "0x313ce567"
+_BALANCE_OF_SELECTOR = "0x70a08231"
+_AGGREGATE3_SELECTOR = "0x82ad56cb"
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Upper bound on calls per JSON-RPC batch; larger batches get throttled by public providers.
+_BATCH_SIZE = 8
+
+# Last configuration written by `configure`, and the (private_key, address, rpc_url) it was written for.
+_CONFIG_CACHE = None
+_CONFIG_KEY = None
+_CONFIG_LOCK = threading.Lock()
 
 def configure(private_key: str, address: str, rpc_url: str = "https://arb1.arbitrum.io/rpc"):
     """
@@ -21,7 +53,16 @@ def configure(private_key: str, address: str, rpc_url: str = "https://arb1.arbit
     -------
     None
         Modifies the configuration in place by updating or setting the user's configuration.
+
+    Notes:
+    ------
+    The configuration is only read from disk on the first call. Later calls with the same
+    credentials return immediately, and calls with new credentials reuse the cached
+    configuration and only write it back.
     """
+    global _CONFIG_CACHE, _CONFIG_KEY
+
+    key = (private_key, address, rpc_url)
     config_data ={
         "arbitrum": {
             "rpc": rpc_url,
@@ -36,14 +77,50 @@ def configure(private_key: str, address: str, rpc_url: str = "https://arb1.arbit
         "user_wallet_address": address
     }
 
-    config_object = Config()
+    with _CONFIG_LOCK:
+        if _CONFIG_KEY == key:
+            return
+
+        config_object = Config()
 
-    new_config = config_object.load_config()
+        new_config = _CONFIG_CACHE if _CONFIG_CACHE is not None else config_object.load_config()
 
-    for key in config_data:
-        new_config[key] = config_data[key]
+        for config_key in config_data:
+            new_config[config_key] = config_data[config_key]
 
-    config_object.set_config(new_config)
+        config_object.set_config(new_config)
+
+        _CONFIG_CACHE = new_config
+        _CONFIG_KEY = key
+
+
+def create_http_session(pool_connections: int = 20, pool_maxsize: int = 50) -> requests.Session:
+    """
+    Creates a pooled, keep-alive HTTP session to be shared by every RPC call of a client.
+
+    Parameters:
+    ----------
+    pool_connections : int
+        The number of distinct hosts to keep connection pools for.
+    pool_maxsize : int
+        The maximum number of connections kept open per host.
+
+    Returns:
+    -------
+    requests.Session
+        A session with retrying adapters mounted on both http:// and https://.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(total=3, backoff_factor=0.1)
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({"Connection": "keep-alive"})
+
+    return session
 
 
 def position_are_the_same(old_positions: List[Position], new_positions: List[Position]) -> bool:
@@ -64,12 +141,14 @@ def position_are_the_same(old_positions: List[Position], new_positions: List[Pos
     """
     if len(old_positions) != len(new_positions):
         return False
-    
-    for old_position in old_positions:
-        if not old_position in new_positions:
-            return False
-        
-    return True
+
+    old_by_id = {position.position_id: position for position in old_positions}
+    new_by_id = {position.position_id: position for position in new_positions}
+
+    if old_by_id.keys() != new_by_id.keys():
+        return False
+
+    return all(old_by_id[position_id] == new_by_id[position_id] for position_id in old_by_id)
 
 
 def determine_added_and_removed_positions(old_positions: List[Position], new_positions: List[Position]) \
@@ -89,27 +168,195 @@ def determine_added_and_removed_positions(old_positions: List[Position], new_pos
     Tuple[List[Position], List[Position]]
         A tuple containing two lists: positions that have been added and positions that have been removed.
     """
-    added_positions = []
-    removed_positions = []
+    old_ids = {position.position_id for position in old_positions}
+    new_ids = {position.position_id for position in new_positions}
 
-    old_position_ids = [ position.position_id for position in old_positions ]
-    new_position_ids = [ position.position_id for position in new_positions ]
+    # Filtering the input lists keeps the positions in their original order.
+    added_positions = [position for position in new_positions if position.position_id not in old_ids]
+    removed_positions = [position for position in old_positions if position.position_id not in new_ids]
 
-    for position in old_positions:
-        if position.position_id not in new_position_ids:
-            removed_positions.append(position)
+    return added_positions, removed_positions
 
-    for position in new_positions:
-        if position.position_id not in old_position_ids:
-            added_positions.append(position)
 
-    return added_positions, removed_positions
+@lru_cache(maxsize=256)
+def _checksum(address: str) -> str:
+    """
+    Returns the EIP-55 checksummed form of `address`, memoized since checksumming hashes the address.
+    """
+    return Web3.to_checksum_address(address)
+
+
+def _erc20_calls(owner: str, tokens: List[dict]) -> Tuple[List[Tuple[str, str]], List[str]]:
+    """
+    Builds the `(to, data)` calls reading each token's balance of `owner`, plus `decimals()` for tokens
+    not yet in the decimals cache, from pre-encoded calldata. Also returns, per call, the token address
+    whose decimals it reads, or None for balance reads.
+    """
+    balance_of = _balance_of_calldata(owner)
+
+    calls = []
+    decimals_for = []
+    for contract_info in tokens:
+        token_address = contract_info.get("address")
+        checksum_address = contract_info.get("address_checksum")
+
+        if token_address not in _DECIMALS_CACHE:
+            calls.append((checksum_address, _DECIMALS_SELECTOR))
+            decimals_for.append(token_address)
+        calls.append((checksum_address, balance_of))
+        decimals_for.append(None)
+
+    return calls, decimals_for
+
+
+def _aggregate3_call(calls: List[Tuple[str, str]]) -> dict:
+    """
+    Returns the `eth_call` transaction bundling `(to, data)` calls into one Multicall3
+    `aggregate3((address,bool,bytes)[])` call, encoded with eth_abi. Any failing call reverts the bundle.
+    """
+    encoded_calls = [(to, False, Web3.to_bytes(hexstr=data)) for to, data in calls]
+    data = _AGGREGATE3_SELECTOR + encode(["(address,bool,bytes)[]"], [encoded_calls]).hex()
+
+    return {"to": MULTICALL3_ADDRESS, "data": data}
+
+
+def _decode_aggregate3(return_data: bytes) -> List[bytes]:
+    """
+    Returns the return data of each call bundled by `_aggregate3_call`, or None when the node returned
+    no data because Multicall3 is not deployed on the chain.
+    """
+    if not return_data:
+        return None
+
+    return [call_return_data for _, call_return_data in decode(["(bool,bytes)[]"], return_data)[0]]
+
+
+def _collect_erc20_results(decimals_for: List[str], results: List[bytes]) -> List[int]:
+    """
+    Stores the decimals read by `_erc20_calls` in the decimals cache and returns the raw balances.
+    """
+    balances_wei = []
+    for token_address, return_data in zip(decimals_for, results):
+        if token_address is not None:
+            _DECIMALS_CACHE[token_address] = decode(["uint8"], return_data)[0]
+        else:
+            balances_wei.append(decode(["uint256"], return_data)[0])
+
+    return balances_wei
+
+
+def _fetch_erc20_balances(session: requests.Session, rpc_url: str, owner: str, tokens: List[dict],
+                          extra_calls: List[Tuple[str, list]] = ()) -> Tuple[List[int], list]:
+    """
+    Fetches the raw balances of `owner` for each token with a single Multicall3 `aggregate3` `eth_call`,
+    sent in one JSON-RPC batch together with `extra_calls`. Where Multicall3 is not deployed, the token
+    calls are resent individually as JSON-RPC batches. Returns the raw balances and the results of `extra_calls`.
+    """
+    calls, decimals_for = _erc20_calls(owner, tokens)
+    results = _post_rpc_batch(session, rpc_url, [("eth_call", [_aggregate3_call(calls), "latest"]), *extra_calls])
+
+    return_data = _decode_aggregate3(Web3.to_bytes(hexstr=results[0]))
+    if return_data is None:
+        fallback_results = _post_rpc_batch(
+            session, rpc_url, [("eth_call", [{"to": to, "data": data}, "latest"]) for to, data in calls]
+        )
+        return_data = [Web3.to_bytes(hexstr=result) for result in fallback_results]
+
+    return _collect_erc20_results(decimals_for, return_data), results[1:]
+
+
+def _token_balances(tokens: List[dict], balances_wei: List[int]) -> List[TokenBalance]:
+    """
+    Wraps the raw balances of `tokens` into TokenBalance objects denominated in token units.
+    """
+    return [
+        TokenBalance(
+            balance=_to_token_units(balance_wei, contract_info.get("address")),
+            name=contract_info.get("coin_name"),
+            contract_id=contract_info.get("address")
+        )
+        for contract_info, balance_wei in zip(tokens, balances_wei)
+    ]
+
+
+def _post_rpc(session: requests.Session, rpc_url: str, method: str, params: list):
+    """
+    Sends a single JSON-RPC request, encoded and decoded with orjson, and returns its result.
+
+    Raises:
+    RpcError: If the node answers with a JSON-RPC error.
+    """
+    payload = {"jsonrpc": "2.0", "method": method, "params": params, "id": 1}
+    response = session.post(rpc_url, data=orjson.dumps(payload), headers=_JSON_HEADERS, timeout=10)
+    response.raise_for_status()
+
+    body = orjson.loads(response.content)
+    if not isinstance(body, dict) or "error" in body or "result" not in body:
+        error = body.get("error", body) if isinstance(body, dict) else body
+        raise RpcError(f"JSON-RPC error for {method}: {error}", response)
+
+    return body["result"]
+
+
+def _post_rpc_batch(session: requests.Session, rpc_url: str, calls: List[Tuple[str, list]],
+                    batch_size: int = _BATCH_SIZE) -> list:
+    """
+    Sends `(method, params)` JSON-RPC calls as batches of at most `batch_size` calls, encoded and
+    decoded with orjson, and returns their results in call order. If the node rejects a batch as a
+    whole, its calls are resent one request at a time.
+
+    Raises:
+    RpcError: If the node leaves a call unanswered or answers any call with a JSON-RPC error.
+    """
+    results = []
+    for start in range(0, len(calls), batch_size):
+        payload = [
+            {"jsonrpc": "2.0", "method": method, "params": params, "id": request_id}
+            for request_id, (method, params) in enumerate(calls[start:start + batch_size], start)
+        ]
+        response = session.post(rpc_url, data=orjson.dumps(payload), headers=_JSON_HEADERS, timeout=10)
+        response.raise_for_status()
+
+        body = orjson.loads(response.content)
+        # A node that rate limits or does not support batching answers with a single error object.
+        if not isinstance(body, list):
+            results.extend(_post_rpc(session, rpc_url, method, params) for method, params in calls[start:start + batch_size])
+            continue
+
+        # Batch responses may come back in any order.
+        responses_by_id = {item.get("id"): item for item in body if isinstance(item, dict)}
+        for request in payload:
+            item = responses_by_id.get(request["id"])
+            if item is None:
+                raise RpcError(f"JSON-RPC batch response is missing id {request['id']} ({request['method']})", response)
+            if "error" in item or "result" not in item:
+                raise RpcError(f"JSON-RPC error for {request['method']}: {item.get('error', item)}", response)
+            results.append(item["result"])
+
+    return results
+
+
+def _to_token_units(balance_wei: int, token_address: str) -> float:
+    """
+    Converts a raw token balance to token units using the token's cached decimals.
+    """
+    decimals = _DECIMALS_CACHE[token_address]
+    scale = _DECIMALS_SCALE.get(decimals)
+    if scale is None:
+        scale = _DECIMALS_SCALE[decimals] = 10 ** decimals
+
+    return balance_wei / scale
 
 
 def get_erc20tokens(w3: Web3, address: str) -> List[TokenBalance]:
     """
     Retrieves the token balances for a specified address from a predefined list of ERC-20 tokens.
 
+    All `decimals()` and `balanceOf(address)` calls are bundled into a single Multicall3
+    `aggregate3` call sent through `w3`, so the balances are fetched in one RPC round trip.
+    On chains where Multicall3 is not deployed, the calls are sent one by one instead.
+    Token decimals are immutable and are only requested the first time a token is seen.
+
     Args:
     w3 (Web3): An instance of Web3 to interact with the Ethereum blockchain.
     address (str): The Ethereum address from which the token balances will be retrieved.
@@ -118,46 +365,143 @@ def get_erc20tokens(w3: Web3, address: str) -> List[TokenBalance]:
     List[TokenBalance]: A list of TokenBalance objects, each containing the balance, name,
                         and contract ID for each ERC-20 token.
     """
-    token_balances = []
+    tokens = ERC_20_DATA.get("erc20Tokens", [])
+    # Checksummed once (memoized across polls) and reused for every balanceOf call.
+    owner = _checksum(address)
 
-    decimals = 18  # Default decimals set to 18
+    calls, decimals_for = _erc20_calls(owner, tokens)
+    return_data = _decode_aggregate3(w3.eth.call(_aggregate3_call(calls)))
+    if return_data is None:
+        return_data = [w3.eth.call({"to": to, "data": data}) for to, data in calls]
 
-    for contract_info in ERC_20_DATA.get("erc20Tokens", []):
-        token_address = contract_info.get("address")
-        coin_name = contract_info.get("coin_name")
+    return _token_balances(tokens, _collect_erc20_results(decimals_for, return_data))
 
-        checksum_address = w3.to_checksum_address(token_address)
+def get_eth_balance(w3: Web3, address: str) -> float:
+    """
+    Retrieves the Ether balance for a specified address.
 
-        token_contract = w3.eth.contract(checksum_address, abi=TOKEN_ABI)
+    Args:
+    w3 (Web3): An instance of Web3 to interact with the Ethereum blockchain.
+    address (str): The Ethereum address from which the Ether balance will be retrieved.
 
-        decimals = token_contract.functions.decimals().call()
+    Returns:
+    float: The Ether balance of the specified address.
+    """
+    checksum_address = _checksum(address)
+    balance_wei = w3.eth.get_balance(checksum_address)
+    balance = balance_wei / _ETH_WEI
+
+    return balance
 
-        balance_wei = token_contract.functions.balanceOf(w3.to_checksum_address(address)).call()
-        balance_token_units = balance_wei / 10 ** decimals
 
-        token_balances.append(
-            TokenBalance(
-                balance=balance_token_units,
-                name=coin_name,
-                contract_id=token_address
-            )
+def get_collateral_balances_raw(session: requests.Session, rpc_url: str, address: str) -> Tuple[List[TokenBalance], float]:
+    """
+    Retrieves the ERC-20 token balances and the Ether balance for a specified address, bypassing web3.
+
+    The token reads are bundled into one Multicall3 `aggregate3` call, as in `get_erc20tokens`, and
+    sent through `session` in the same JSON-RPC batch as `eth_getBalance`. Requests and responses are
+    handled with orjson, skipping web3's middleware and ABI machinery.
+
+    Args:
+    session (requests.Session): The HTTP session used to reach the RPC node.
+    rpc_url (str): The RPC URL of the node to query.
+    address (str): The Ethereum address from which the balances will be retrieved.
+
+    Returns:
+    Tuple[List[TokenBalance], float]: The ERC-20 token balances and the Ether balance of the address.
+    """
+    tokens = ERC_20_DATA.get("erc20Tokens", [])
+    owner = _checksum(address)
+
+    balances_wei, (eth_balance_wei,) = _fetch_erc20_balances(
+        session, rpc_url, owner, tokens, [("eth_getBalance", [owner, "latest"])]
+    )
+
+    return _token_balances(tokens, balances_wei), int(eth_balance_wei, 16) / _ETH_WEI
+
+
+def _balance_of_calldata(owner: str) -> str:
+    """
+    Returns the `balanceOf(owner)` calldata: the selector followed by the owner address left-padded to 32 bytes.
+    """
+    return _BALANCE_OF_SELECTOR + owner[2:].lower().rjust(64, "0")
+
+
+async def _arpc(session: aiohttp.ClientSession, rpc_url: str, method: str, params: list):
+    """
+    Sends a single JSON-RPC request over `session` and returns its result.
+
+    Raises:
+    RpcError: If the node answers with a JSON-RPC error.
+    """
+    payload = {"jsonrpc": "2.0", "method": method, "params": params, "id": 1}
+    async with session.post(rpc_url, json=payload) as response:
+        response.raise_for_status()
+        body = await response.json(content_type=None)
+
+    if "error" in body or "result" not in body:
+        raise RpcError(f"JSON-RPC error for {method}: {body.get('error', body)}")
+
+    return body["result"]
+
+
+async def aget_erc20tokens(session: aiohttp.ClientSession, rpc_url: str, address: str) -> List[TokenBalance]:
+    """
+    Asynchronously retrieves the token balances for a specified address from a predefined list of ERC-20 tokens.
+
+    Like `get_erc20tokens`, every `balanceOf(address)` call, plus a `decimals()` call for tokens not
+    yet in the decimals cache, is bundled into one Multicall3 `aggregate3` call sent over the given
+    aiohttp session. Where Multicall3 is not deployed, the calls are sent concurrently instead.
+
+    Args:
+    session (aiohttp.ClientSession): The HTTP session used to reach the RPC node.
+    rpc_url (str): The RPC URL of the node to query.
+    address (str): The Ethereum address from which the token balances will be retrieved.
+
+    Returns:
+    List[TokenBalance]: A list of TokenBalance objects, each containing the balance, name,
+                        and contract ID for each ERC-20 token.
+    """
+    tokens = ERC_20_DATA.get("erc20Tokens", [])
+    calls, decimals_for = _erc20_calls(_checksum(address), tokens)
+
+    result = await _arpc(session, rpc_url, "eth_call", [_aggregate3_call(calls), "latest"])
+    return_data = _decode_aggregate3(Web3.to_bytes(hexstr=result))
+    if return_data is None:
+        results = await asyncio.gather(
+            *(_arpc(session, rpc_url, "eth_call", [{"to": to, "data": data}, "latest"]) for to, data in calls)
         )
+        return_data = [Web3.to_bytes(hexstr=result) for result in results]
 
-    return token_balances
+    return _token_balances(tokens, _collect_erc20_results(decimals_for, return_data))
 
-def get_eth_balance(w3: Web3, address: str) -> float:
+
+async def aget_eth_balance(session: aiohttp.ClientSession, rpc_url: str, address: str) -> float:
     """
-    Retrieves the Ether balance for a specified address.
+    Asynchronously retrieves the Ether balance for a specified address.
 
     Args:
-    w3 (Web3): An instance of Web3 to interact with the Ethereum blockchain.
+    session (aiohttp.ClientSession): The HTTP session used to reach the RPC node.
+    rpc_url (str): The RPC URL of the node to query.
     address (str): The Ethereum address from which the Ether balance will be retrieved.
 
     Returns:
     float: The Ether balance of the specified address.
     """
-    checksum_address = w3.to_checksum_address(address)
-    balance_wei = w3.eth.get_balance(checksum_address)
-    balance = w3.from_wei(balance_wei, 'ether')
+    balance_wei = int(await _arpc(session, rpc_url, "eth_getBalance", [_checksum(address), "latest"]), 16)
 
-    return balance
+    return balance_wei / _ETH_WEI
+
+
+async def aget_block_number(session: aiohttp.ClientSession, rpc_url: str) -> int:
+    """
+    Asynchronously retrieves the number of the latest block.
+
+    Args:
+    session (aiohttp.ClientSession): The HTTP session used to reach the RPC node.
+    rpc_url (str): The RPC URL of the node to query.
+
+    Returns:
+    int: The latest block number.
+    """
+    return int(await _arpc(session, rpc_url, "eth_blockNumber", []), 16)